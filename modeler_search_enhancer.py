@@ -6,12 +6,52 @@
  ***************************************************************************/
 """
 
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, QTimer, Qt, QSortFilterProxyModel, QStringListModel, QUrl
+from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, QTimer, Qt, QSortFilterProxyModel, QRegularExpression, QUrl, QObject, QEvent, QSignalBlocker, QModelIndex
 from qgis.PyQt.QtGui import QIcon, QDesktopServices
-from qgis.PyQt.QtWidgets import QAction, QDialog, QLabel, QCompleter, QComboBox, QMessageBox
+from qgis.PyQt.QtWidgets import QAction, QApplication, QDialog, QLabel, QCompleter, QComboBox, QMessageBox
 from qgis.core import QgsApplication
+import logging
 import os
 import os.path
+import re
+from weakref import WeakSet
+
+
+_MODELER_ITEM_KWS = (
+    '"', "dall'algoritmo", 'from algorithm', 'output', 'result',
+    'estratto', 'elementi', 'risultato'
+)
+_INPUT_CTX_KWS = (
+    'layer in ingresso', 'input layer', 'layer input',
+    'utilizzo del risultato', 'use result', 'algorithm result',
+    'campo rimanente', 'remaining field',
+    'selezione', 'selection', 'choose', 'select'
+)
+_EXCLUDE_CTX_KWS = (
+    'dependencies', 'dipendenze', 'parameters', 'parametri',
+    'configuration', 'configurazione', 'settings', 'impostazioni'
+)
+
+_BOOL_LITERALS = frozenset(('true', 'false', 'yes', 'no'))
+
+_POS_RE = re.compile('|'.join(map(re.escape, _MODELER_ITEM_KWS)), re.IGNORECASE)
+_NEG_CTX_RE = re.compile('|'.join(map(re.escape, _EXCLUDE_CTX_KWS)), re.IGNORECASE)
+_INPUT_CTX_RE = re.compile('|'.join(map(re.escape, _INPUT_CTX_KWS)), re.IGNORECASE)
+
+_PLACEHOLDER = "🔍 Digita per filtrare..."
+
+_ENHANCED_QSS = """
+    QLineEdit {
+        background-color: #f0f8f0;
+        border: 2px solid #2E8B57;
+        border-radius: 3px;
+        padding: 2px 5px;
+    }
+    QLineEdit:focus {
+        background-color: white;
+        border-color: #228B22;
+    }
+"""
 
 
 class SearchableComboBox(QComboBox):
@@ -40,20 +80,21 @@ class SearchableComboBox(QComboBox):
         self.setCompleter(self.completer)
         
         self.lineEdit().textEdited.connect(self.pFilterModel.setFilterFixedString)
-        self.completer.activated.connect(self.onCompleterActivated)
+        self.completer.activated[QModelIndex].connect(self.onCompleterActivated)
 
-    def onCompleterActivated(self, text):
+    def onCompleterActivated(self, index):
         """
         Slot called when an item is activated in the completer.
+        QCompleter emits an index of the proxy filter model, which is mapped back to the combo box model.
         Args:
-            text (str): The text of the activated completer item.
+            index (QModelIndex): The proxy model index of the activated completer item.
         Returns:
             None
         """
-        if text:
-            index = self.findText(text)
-            if index >= 0:
-                self.setCurrentIndex(index)
+        if index.isValid():
+            source_index = self.pFilterModel.mapToSource(index)
+            if source_index.isValid():
+                self.setCurrentIndex(source_index.row())
 
     def setModel(self, model):
         """
@@ -80,7 +121,141 @@ class SearchableComboBox(QComboBox):
         super().setModelColumn(column)
 
 
-class ModelerSearchEnhancer:
+class _ComboFilterController(QObject):
+    def __init__(self, combo_box):
+        """
+        Initializes the controller that filters an enhanced QComboBox as the user types.
+        Args:
+            combo_box (QComboBox): The editable combo box to control. It also becomes the parent of the
+                controller, so the controller is destroyed together with the combo box.
+        Features:
+            - Wraps the combo box model in a case-insensitive QSortFilterProxyModel.
+            - Attaches a QCompleter that shows the proxy model unfiltered in its popup.
+            - Debounces text changes with its own timer and updates the proxy filter once the user pauses typing.
+            - Keeps the combo box selection and the line edit text in sync.
+        """
+        super().__init__(combo_box)
+        self.combo_box = combo_box
+        self.line_edit = combo_box.lineEdit()
+        
+        self._updating = False
+        self._last_search_terms = ()
+        
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.applyFilter)
+        
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(combo_box.model())
+        self.proxy.setFilterKeyColumn(combo_box.modelColumn())
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy.setDynamicSortFilter(False)
+        
+        self.completer = QCompleter(self.proxy, combo_box)
+        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.completer.setCompletionColumn(combo_box.modelColumn())
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        
+        self.line_edit.setCompleter(self.completer)
+        
+        self.line_edit.textChanged.connect(self.onTextChanged)
+        self.completer.activated[QModelIndex].connect(self.onCompleterActivated)
+        self.combo_box.activated.connect(self.onComboActivated)
+
+    def applyFilter(self):
+        """
+        Filters the items in the completer based on the current text in the line edit.
+        Updates the proxy model's filter so that only items matching all search terms entered by the user
+        are shown. If the search text is empty, the filter is cleared and all items are shown.
+        Args:
+            None
+        Returns:
+            None
+        """
+        if self._updating:
+            return
+            
+        search_terms = tuple(self.line_edit.text().split())
+        
+        if search_terms == self._last_search_terms:
+            return
+            
+        self._last_search_terms = search_terms
+        
+        if len(search_terms) > 1:
+            pattern = ''.join(
+                '(?=.*{})'.format(QRegularExpression.escape(term)) for term in search_terms
+            )
+            self.proxy.setFilterRegularExpression(
+                QRegularExpression(pattern, QRegularExpression.CaseInsensitiveOption)
+            )
+        else:
+            self.proxy.setFilterFixedString(search_terms[0] if search_terms else "")
+        
+        if not search_terms:
+            return
+        
+        if self.proxy.rowCount() > 0:
+            if not self.completer.popup().isVisible():
+                self.completer.complete()
+        else:
+            self.completer.popup().hide()
+
+    def onTextChanged(self):
+        """
+        Triggered when the text changes in the line edit. If an update is not already in progress,
+        (re)starts the debounce timer so that the filter runs once the user pauses typing.
+        Args:
+            None
+        Returns:
+            None
+        """
+        if not self._updating:
+            self._filter_timer.start()
+
+    def onCompleterActivated(self, index):
+        """
+        Handles the event when an item is selected from the completer dropdown.
+        QCompleter emits an index of the proxy model, which is mapped back to the combo box row.
+        Args:
+            index (QModelIndex): The proxy model index of the item selected from the completer.
+        Returns:
+            None
+        """
+        if not index.isValid():
+            return
+            
+        source_index = self.proxy.mapToSource(index)
+        if source_index.isValid():
+            self._updating = True
+            
+            self.combo_box.setCurrentIndex(source_index.row())
+            self.line_edit.setText(self.combo_box.itemText(source_index.row()))
+            
+            self._updating = False
+
+    def onComboActivated(self, index):
+        """
+        Handles the activation event of the combo box, updating the line edit with the selected item's text.
+        Args:
+            index (int): The index of the activated item in the combo box.
+        Returns:
+            None
+        """
+        if self._updating:
+            return
+            
+        if 0 <= index < self.combo_box.count():
+            selected_text = self.combo_box.itemText(index)
+            self._updating = True
+            self.line_edit.setText(selected_text)
+            self._updating = False
+
+
+class ModelerSearchEnhancer(QObject):
+    ENHANCE_MIN_ITEMS = 25
+
     def __init__(self, iface):
         """
         Initializes the ModelerSearchEnhancer plugin.
@@ -89,6 +264,7 @@ class ModelerSearchEnhancer:
         This method sets up the plugin directory, loads the appropriate locale translation if available,
         and initializes internal data structures for actions, monitored widgets, and enhanced combo boxes.
         """
+        super().__init__()
         self.iface = iface
         self.plugin_dir = os.path.dirname(__file__)
         
@@ -104,8 +280,12 @@ class ModelerSearchEnhancer:
             QCoreApplication.installTranslator(self.translator)
 
         self.actions = []
+        # Strong references: the PyQt wrapper of a window created in C++ only lives as long as someone
+        # holds it, so a WeakSet would lose the entry as soon as eventFilter returns.
         self.monitored_widgets = set()
-        self.enhanced_combos = set()
+        self.enhanced_combos = WeakSet()
+        self._focus_fallback_enabled = False
+        self._log = logging.getLogger('ModelerSearchEnhancer')
         
     def tr(self, message):
         """
@@ -200,91 +380,203 @@ class ModelerSearchEnhancer:
 
     def setupModelerMonitoring(self):
         """
-        Sets up a QTimer to periodically check for modeler widgets in the QGIS interface.
-        This method initializes a QTimer instance, connects its timeout signal to the
-        checkForModelerWidgets method, and starts the timer with a 500 ms interval.
+        Sets up event-driven detection of modeler widgets in the QGIS interface.
+        This method installs the plugin as an application-wide event filter, so that top-level
+        windows are inspected only when they are shown or activated. Windows that are already open
+        are checked once.
         Args:
             None
         Returns:
             None
         """
-        self.window_timer = QTimer()
-        self.window_timer.timeout.connect(self.checkForModelerWidgets)
-        self.window_timer.start(500)
+        QgsApplication.instance().installEventFilter(self)
+        self.checkForModelerWidgets()
+
+    def eventFilter(self, obj, event):
+        """
+        Application-wide event filter that inspects top-level windows when they are shown or activated,
+        and stops monitoring Modeler windows when they are hidden.
+        Args:
+            obj (QObject): The object receiving the event.
+            event (QEvent): The event being delivered.
+        Returns:
+            bool: Always False, so the event continues to be processed normally.
+        """
+        event_type = event.type()
+        if event_type in (QEvent.Show, QEvent.WindowActivate):
+            if obj.isWidgetType() and obj.isWindow():
+                self.checkForModelerWidget(obj)
+        elif event_type == QEvent.Hide and obj.isWidgetType() and obj.isWindow():
+            self.stopMonitoring(obj)
+        return False
+
+    def stopMonitoring(self, widget):
+        """
+        Stops monitoring the given window and disconnects the focus fallback once no Modeler window is left.
+        Args:
+            widget (QWidget): The window that was hidden or destroyed.
+        Returns:
+            None
+        """
+        self.monitored_widgets.discard(widget)
+        if not self.monitored_widgets:
+            self.setFocusFallbackEnabled(False)
+
+    def setFocusFallbackEnabled(self, enabled):
+        """
+        Connects or disconnects the application's focusChanged signal to the focus fallback.
+        The fallback is only needed while at least one Modeler window is open.
+        Args:
+            enabled (bool): Whether the fallback should be connected.
+        Returns:
+            None
+        """
+        if enabled == self._focus_fallback_enabled:
+            return
+
+        app = QgsApplication.instance()
+        if enabled:
+            app.focusChanged.connect(self.onFocusChanged)
+        else:
+            app.focusChanged.disconnect(self.onFocusChanged)
+        self._focus_fallback_enabled = enabled
+
+    def onFocusChanged(self, old, now):
+        """
+        Fallback used only while a Modeler window is open. Combo boxes added to a monitored window after
+        it was shown are enhanced when the focus moves, and other windows that receive the focus in the
+        meantime are checked as well.
+        Args:
+            old (QWidget): The widget that lost focus.
+            now (QWidget): The widget that gained focus.
+        Returns:
+            None
+        """
+        if now is None:
+            return
+
+        window = now.window()
+        if window in self.monitored_widgets:
+            self.enhanceModelerWidget(window)
+        else:
+            self.checkForModelerWidget(window)
 
     def checkForModelerWidgets(self):
         """
-        Checks for currently visible Modeler widgets in the QGIS application, enhances any new ones found,
-        and updates the set of monitored widgets.
-        Iterates through all widgets in the application, identifies those that are Modeler widgets and visible,
-        enhances any that are not already being monitored, and updates the internal set of monitored widgets.
+        Checks all currently visible top-level windows once, so that Modeler windows opened before the
+        plugin was loaded are enhanced as well.
         Args:
             None
         Returns:
             None
         """
-        current_widgets = set()
-        
-        for widget in QgsApplication.allWidgets():
-            if widget and hasattr(widget, 'isVisible') and widget.isVisible():
-                if self.isModelerWidget(widget):
-                    current_widgets.add(widget)
-                    
-                    if widget not in self.monitored_widgets:
-                        self.enhanceModelerWidget(widget)
+        for widget in QApplication.topLevelWidgets():
+            if widget.isVisible():
+                self.checkForModelerWidget(widget)
+
+    def checkForModelerWidget(self, widget):
+        """
+        Enhances the given widget if it is a Modeler widget that is not being monitored yet.
+        Args:
+            widget (QWidget): The widget to check.
+        Returns:
+            None
+        """
+        if widget in self.monitored_widgets:
+            return
+
+        if not self.hasModelerIdentity(widget):
+            return
+
+        combos = widget.findChildren(QComboBox)
+        if self.isModelerWidget(widget, combos, identity_checked=True):
+            self.enhanceModelerWidget(widget, combos)
+            self.monitored_widgets.add(widget)
+            if not widget.property("_se_monitor_hooked"):
+                widget.destroyed.connect(lambda _=None, w=widget: self.stopMonitoring(w))
+                widget.setProperty("_se_monitor_hooked", True)
+            self.setFocusFallbackEnabled(True)
+
+    def hasModelerIdentity(self, widget):
+        """
+        Checks the cheap, string-based Modeler indicators of a widget: its object name, its window title
+        and, for dialogs, the "utilizzo del risultato" title. No child widgets are looked up.
+        Args:
+            widget (QWidget): The widget to check.
+        Returns:
+            bool: True if the object name or window title identifies a Modeler widget, False otherwise.
+        """
+        window_title = widget.windowTitle().lower()
+        object_name = widget.objectName().lower()
         
-        self.monitored_widgets = current_widgets
+        return (
+            'modeler' in object_name or
+            'tabella' in window_title or
+            'selezione' in window_title or
+            (isinstance(widget, QDialog) and 'utilizzo del risultato' in window_title)
+        )
 
-    def isModelerWidget(self, widget):
+    def isModelerWidget(self, widget, combos=None, identity_checked=False):
         """
         Determines whether the given widget is a "Modeler" widget based on its properties.
+        A widget is a Modeler widget if hasModelerIdentity matches and it contains at least one QComboBox.
         Args:
             widget (QWidget): The widget to check.
+            combos (list, optional): The QComboBox children of the widget, if already known.
+            identity_checked (bool, optional): Whether the caller has already run hasModelerIdentity.
         Returns:
             bool: True if the widget is identified as a Modeler widget, False otherwise.
         """
         if not widget:
             return False
-            
-        try:
-            window_title = getattr(widget, 'windowTitle', lambda: '')().lower()
-            object_name = getattr(widget, 'objectName', lambda: '')().lower()
-            
-            modeler_indicators = [
-                ('tabella' in window_title or 'selezione' in window_title) and len(widget.findChildren(QComboBox)) > 0,
-                'modeler' in object_name and len(widget.findChildren(QComboBox)) > 0,
-                isinstance(widget, QDialog) and len(widget.findChildren(QComboBox)) > 0 and 'utilizzo del risultato' in window_title.lower()
-            ]
-            
-            return any(modeler_indicators)
-            
-        except Exception:
+        
+        if not identity_checked and not self.hasModelerIdentity(widget):
             return False
+        
+        if combos is None:
+            combos = widget.findChildren(QComboBox)
+        return bool(combos)
 
-    def enhanceModelerWidget(self, widget):
+    def enhanceModelerWidget(self, widget, combo_boxes=None):
         """
         Enhances all QComboBox widgets within the given widget by adding search functionality,
         if they meet certain criteria and have not already been enhanced.
         Args:
             widget (QWidget): The parent widget containing QComboBox children to enhance.
+            combo_boxes (list, optional): The QComboBox children of the widget, if already known.
         Returns:
             None
         """
         try:
-            combo_boxes = widget.findChildren(QComboBox)
+            if combo_boxes is None:
+                combo_boxes = widget.findChildren(QComboBox)
             
-            for combo_box in combo_boxes:
-                if (combo_box not in self.enhanced_combos and 
-                    combo_box.count() > 1 and 
-                    not hasattr(combo_box, '_search_enhanced') and
-                    self.shouldEnhanceComboBox(combo_box)):
+            updates_disabled = False
+            try:
+                for combo_box in combo_boxes:
+                    if combo_box.property("_se_enhanced"):
+                        continue
                     
-                    self.enhanceComboBox(combo_box)
-                    self.enhanced_combos.add(combo_box)
-                    combo_box._search_enhanced = True
+                    if (combo_box not in self.enhanced_combos and 
+                        combo_box.count() >= self.ENHANCE_MIN_ITEMS and 
+                        combo_box.isEnabled() and
+                        self.shouldEnhanceComboBox(combo_box)):
+                        
+                        if not updates_disabled:
+                            widget.setUpdatesEnabled(False)
+                            updates_disabled = True
+                        
+                        with QSignalBlocker(combo_box):
+                            self.enhanceComboBox(combo_box)
+                        self.enhanced_combos.add(combo_box)
+                        combo_box.destroyed.connect(lambda _=None, c=combo_box: self.enhanced_combos.discard(c))
+                        combo_box.setProperty("_se_enhanced", True)
+            finally:
+                if updates_disabled:
+                    widget.setUpdatesEnabled(True)
                     
-        except Exception as e:
-            pass
+        except Exception:
+            self._log.debug("Could not enhance the combo boxes of %r", widget, exc_info=True)
 
     def shouldEnhanceComboBox(self, combo_box):
         """
@@ -297,38 +589,36 @@ class ModelerSearchEnhancer:
         to represent a modeler input or output, and excludes cases where the combo box is too simple or irrelevant.
         """
         try:
-            if combo_box.count() == 0:
+            if combo_box.count() < self.ENHANCE_MIN_ITEMS:
                 return False
             
             sample_items = []
-            for i in range(min(3, combo_box.count())):
+            has_pos = False
+            for i in range(3):
                 item_text = combo_box.itemText(i)
-                if item_text:
-                    sample_items.append(item_text.lower())
-            
-            modeler_input_indicators = [
-                any('"' in item for item in sample_items),
-                any('dall\'algoritmo' in item for item in sample_items),
-                any('from algorithm' in item for item in sample_items),
-                any('output' in item for item in sample_items),
-                any('result' in item for item in sample_items),
-                any('estratto' in item or 'elementi' in item or 'risultato' in item for item in sample_items),
-            ]
-            
-            exclude_indicators = [
-                combo_box.count() < 3,
-                all(item.isdigit() or item in ['true', 'false', 'yes', 'no'] for item in sample_items if item),
-                all(len(item) < 10 for item in sample_items if item),
-                combo_box.count() == 1 and sample_items and ('dipendenze' in sample_items[0] or 'dependencies' in sample_items[0]),
-            ]
+                if not item_text:
+                    continue
+                
+                item = item_text.lower()
+                if _POS_RE.search(item):
+                    has_pos = True
+                    if len(item) >= 10:
+                        # A long item with a keyword hit rules out every exclusion below.
+                        return self.analyzeParentContext(combo_box)
+                sample_items.append(item)
             
-            parent_context = self.analyzeParentContext(combo_box)
+            if not has_pos:
+                return False
             
-            should_enhance = any(modeler_input_indicators) and not any(exclude_indicators) and parent_context
+            if all(item.isdigit() or item in _BOOL_LITERALS for item in sample_items):
+                return False
+            if all(len(item) < 10 for item in sample_items):
+                return False
             
-            return should_enhance
+            return self.analyzeParentContext(combo_box)
             
-        except Exception as e:
+        except RuntimeError:
+            # The combo box was deleted on the C++ side while it was being analyzed.
             return False
 
     def analyzeParentContext(self, combo_box):
@@ -347,25 +637,13 @@ class ModelerSearchEnhancer:
             
             labels = parent.findChildren(QLabel)
             
-            input_context_keywords = [
-                'layer in ingresso', 'input layer', 'layer input',
-                'utilizzo del risultato', 'use result', 'algorithm result',
-                'campo rimanente', 'remaining field',
-                'selezione', 'selection', 'choose', 'select'
-            ]
-            
-            exclude_context_keywords = [
-                'dependencies', 'dipendenze', 'parameters', 'parametri',
-                'configuration', 'configurazione', 'settings', 'impostazioni'
-            ]
-            
             for label in labels:
-                label_text = label.text().lower()
+                label_text = label.text()
                 
-                if any(keyword in label_text for keyword in exclude_context_keywords):
+                if _NEG_CTX_RE.search(label_text):
                     return False
                     
-                if any(keyword in label_text for keyword in input_context_keywords):
+                if _INPUT_CTX_RE.search(label_text):
                     return True
             
             return True
@@ -376,166 +654,45 @@ class ModelerSearchEnhancer:
     def enhanceComboBox(self, combo_box):
         """
         Enhances a given QComboBox with advanced search and filtering capabilities.
-        This method makes the combo box editable, adds a placeholder, and attaches a QCompleter
+        This method makes the combo box editable, adds a placeholder, and attaches a _ComboFilterController
         that allows users to filter items by typing. The filtering is case-insensitive and matches
-        all search terms. The method also synchronizes the selection between the combo box and the
-        completer, and applies custom styling to the line edit.
+        all search terms. The controller also synchronizes the selection between the combo box and the
+        completer. Finally, custom styling is applied to the line edit.
         Args:
             combo_box (QComboBox): The combo box widget to enhance.
         Returns:
             bool: True if the enhancement was successful, False otherwise.
         """
         try:
-            original_items = []
-            for i in range(combo_box.count()):
-                original_items.append(combo_box.itemText(i))
-            
             if not combo_box.isEditable():
                 combo_box.setEditable(True)
             
             line_edit = combo_box.lineEdit()
             if line_edit:
-                line_edit.setPlaceholderText("🔍 Digita per filtrare...")
-                
-                self._is_updating = False
-                self._last_search_text = ""
-                
-                completer = QCompleter(original_items)
-                completer.setCaseSensitivity(Qt.CaseInsensitive)
-                completer.setFilterMode(Qt.MatchContains)
-                completer.setCompletionMode(QCompleter.PopupCompletion)
-                
-                line_edit.setCompleter(completer)
+                line_edit.setPlaceholderText(_PLACEHOLDER)
                 
-                def safe_filter():
-                    """
-                    Filters the items in the completer based on the current text in the line edit.
-                    Updates the completer's model to show only items that match all search terms entered by the user.
-                    If the search text is empty, restores the original list of items.
-                    Args:
-                        None
-                    Returns:
-                        None
-                    """
-                    if self._is_updating:
-                        return
-                        
-                    current_text = line_edit.text().strip()
-                    
-                    if current_text == self._last_search_text:
-                        return
-                        
-                    self._last_search_text = current_text
-                    
-                    if current_text:
-                        filtered_items = []
-                        search_terms = current_text.lower().split()
-                        
-                        for item in original_items:
-                            item_lower = item.lower()
-                            if all(term in item_lower for term in search_terms):
-                                filtered_items.append(item)
-                        
-                        if filtered_items:
-                            completer_model = QStringListModel(filtered_items)
-                            completer.setModel(completer_model)
-                            
-                            if not completer.popup().isVisible():
-                                completer.complete()
-                        else:
-                            completer.popup().hide()
-                    else:
-                        completer_model = QStringListModel(original_items)
-                        completer.setModel(completer_model)
-                
-                line_edit.editingFinished.connect(safe_filter)
-                
-                self._filter_timer = QTimer()
-                self._filter_timer.setSingleShot(True)
-                self._filter_timer.timeout.connect(safe_filter)
-                
-                def on_text_changed():
-                    """
-                    Triggered when the text changes in the associated widget. If an update is not already in progress,
-                    starts a timer to delay filtering by 300 milliseconds.
-                    Args:
-                        None
-                    Returns:
-                        None
-                    """
-                    if not self._is_updating:
-                        self._filter_timer.start(300)
+                _ComboFilterController(combo_box)
                 
-                line_edit.textChanged.connect(on_text_changed)
-                
-                def on_completer_activated(text):
-                    """
-                    Handles the event when an item is selected from the completer dropdown.
-                    Args:
-                        text (str): The text selected from the completer.
-                    Returns:
-                        None
-                    """
-                    if text in original_items:
-                        self._is_updating = True
-                        
-                        index = original_items.index(text)
-                        combo_box.setCurrentIndex(index)
-                        line_edit.setText(text)
-                        
-                        self._is_updating = False
-                
-                completer.activated.connect(on_completer_activated)
-                
-                def on_combo_activated(index):
-                    """
-                    Handles the activation event of the combo box, updating the associated line edit with the selected item's text.
-                    Args:
-                        index (int): The index of the activated item in the combo box.
-                    Returns:
-                        None
-                    """
-                    if self._is_updating:
-                        return
-                        
-                    if 0 <= index < combo_box.count():
-                        selected_text = combo_box.itemText(index)
-                        self._is_updating = True
-                        line_edit.setText(selected_text)
-                        self._is_updating = False
-                
-                combo_box.activated.connect(on_combo_activated)
-                
-                line_edit.setStyleSheet("""
-                    QLineEdit {
-                        background-color: #f0f8f0;
-                        border: 2px solid #2E8B57;
-                        border-radius: 3px;
-                        padding: 2px 5px;
-                    }
-                    QLineEdit:focus {
-                        background-color: white;
-                        border-color: #228B22;
-                    }
-                """)
+                line_edit.setStyleSheet(_ENHANCED_QSS)
                 
                 combo_box.setInsertPolicy(QComboBox.NoInsert)
                 
                 return True
                 
-        except Exception as e:
+        except Exception:
+            self._log.debug("Could not enhance combo box %r", combo_box, exc_info=True)
             return False
 
     def unload(self):
         """
-        Unloads the plugin by stopping timers, clearing internal data structures, and removing plugin actions from the QGIS interface.
+        Unloads the plugin by removing the event filter, clearing internal data structures, and removing plugin actions from the QGIS interface.
         Args:
             None
         Returns:
             None
         """
-        if hasattr(self, 'window_timer'):
-            self.window_timer.stop()
+        QgsApplication.instance().removeEventFilter(self)
+        self.setFocusFallbackEnabled(False)
             
         self.enhanced_combos.clear()
         self.monitored_widgets.clear()